@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Optional
 
 import click
-import yaml
 
 from inferex import __version__
 from inferex.cli.commands.deployments import commands as deployment_commands
@@ -49,6 +48,8 @@ def init(project_path: str, project_name: Optional[str], _: Optional[str]):
     Args:
         path: Full or relative path to project directory.
     """
+    import yaml
+
     path = Path(project_path)
 
     # Check if inferex.yaml already exists
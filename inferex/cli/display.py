@@ -1,17 +1,18 @@
 """ Formatting raw data into tabular data in the terminal. """
 
+import heapq
 import json
 import re
 import sys
 from datetime import datetime, timezone
 from enum import Enum, unique
+from functools import lru_cache
 from typing import List, Optional, Union
 
 import click
-import humanize
-import yaml
-from pygments import formatters, highlight, lexers
-from tabulate import tabulate
+
+# yaml, pygments and tabulate are imported lazily below; they are only
+# needed by output-rendering commands and noticeably slow cold startup
 
 
 CONFIG_DISPLAY_TABLE = {
@@ -32,6 +33,9 @@ DISPLAY_COLUMNS = {
     ],
 }
 
+# columns holding timestamps that get rendered as a natural age
+AGE_KEYS = frozenset({"added_at", "edited_at", "deployment_timestamp"})
+
 # control what columns are renamed as here
 KEY_MAPS = {
     'added_at': "AGE",
@@ -54,11 +58,30 @@ d = days,
 w = weeks
 """
 
-# Regex for IP addresses
-IP_ADDRESS_PATTERN = re.compile(r"(10\.\d{1,3}\.\d{1,3}\.\d{1,3}):(\d{1,5})")
+# One C-level scan for the log level instead of five substring probes per line
+LOG_LEVEL_PATTERN = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b")
+
+# Fused cleanup: operator Task IDs and internal IPs (with their surrounding
+# whitespace) and runs of whitespace all collapse to a single space, so one
+# sub(" ", ...) pass replaces three separate string rewrites
+LOG_CLEAN_PATTERN = re.compile(
+    r"\s*(?:Task:.*:|10\.\d{1,3}\.\d{1,3}\.\d{1,3}:\d{1,5})\s*|\s+"
+)
+
+# Offset of the local timezone, computed once instead of per row/log line
+LOCAL_UTC_OFFSET = datetime.now(timezone.utc).astimezone().utcoffset()
+
+@lru_cache(maxsize=None)
+def _get_highlighter():
+    """ Import Pygments and build the formatter and lexers on first use.
+
+    Constructed once — building a Pygments lexer compiles its regex
+    tables, which is too slow to repeat per call.
+    """
+    from pygments import formatters, highlight, lexers
+
+    return highlight, formatters.TerminalFormatter(), lexers.JsonLexer(), lexers.YamlLexer()
 
-# Formatter for yaml & json
-PYGMENTS_FORMATTER = formatters.TerminalFormatter()
 
 @unique
 class OutputFormat(str, Enum):
@@ -68,6 +91,30 @@ class OutputFormat(str, Enum):
     yaml = "yaml"
 
 
+def _natural_age(seconds: float) -> str:
+    """ Render an age like humanize.naturaltime, without the import cost.
+
+    Args:
+        seconds (float): The age in seconds.
+
+    Returns:
+        str: The rendered age, e.g. "5 minutes ago".
+    """
+    seconds = int(seconds)
+    if seconds < 60:
+        return "now" if seconds < 2 else f"{seconds} seconds ago"
+    if seconds < 3600:
+        count, unit = seconds // 60, "minute"
+    elif seconds < 86400:
+        count, unit = seconds // 3600, "hour"
+    elif seconds < 604800:
+        count, unit = seconds // 86400, "day"
+    else:
+        count, unit = seconds // 604800, "week"
+
+    return f"a{'n' if unit == 'hour' else ''} {unit} ago" if count == 1 else f"{count} {unit}s ago"
+
+
 def get_datetime_age(timestamp: str) -> str:
     """
     Get the age of a datetime string relative to local timezone.
@@ -78,19 +125,18 @@ def get_datetime_age(timestamp: str) -> str:
     Returns:
         str: The age of the datetime string.
     """
-    if not timestamp:
+    if not timestamp or len(timestamp) < 19:
         return timestamp
 
-    # Parse the datetime string, split off microseconds
-    utc_time = datetime.strptime(timestamp.split(".")[0], "%Y-%m-%dT%H:%M:%S")
-
-    # Get the timezone offset
-    timezone_offset = datetime.now(timezone.utc).astimezone().utcoffset()
+    # The layout is fixed "YYYY-MM-DDTHH:MM:SS[.ffffff]", so one slice drops
+    # the sub-second tail without the split allocations, and the C-level
+    # fromisoformat does the parse.
+    utc_time = datetime.fromisoformat(timestamp[:19])
 
     # Convert UTC to local time
-    current_age = utc_time + timezone_offset
+    current_age = utc_time + LOCAL_UTC_OFFSET
 
-    return humanize.naturaltime(current_age)
+    return _natural_age((datetime.now() - current_age).total_seconds())
 
 
 def output_option(function):
@@ -125,28 +171,19 @@ def format_display_data(
     if isinstance(api_data, dict):
         api_data = [api_data]
 
-    def sort_order_helper(item):
-        """ Sorting function for ordering a dict. """
-        if item[0] not in DISPLAY_COLUMNS.get(endpoint):
-            return 0
-        return DISPLAY_COLUMNS.get(endpoint).index(item[0])
-
     formatted_data = []
+    display_columns = DISPLAY_COLUMNS.get(endpoint) if endpoint else None
     for obj in api_data:
-        # create a new dict with sorted, renamed keys
+        # create a new dict with ordered, renamed keys. Walking the column
+        # list directly both orders and filters the keys, with no per-row sort.
         new_data = {}
-        if endpoint:
-            # sort the keys
-            obj = dict(sorted(obj.items(), key=sort_order_helper))
-        for key, val in obj.items():
+        for key in (display_columns or obj.keys()):
+            val = obj.get(key)
             # Skip empty colums for display
             if val is None or val == '':
                 continue
-            # Skip columns that are not in the display columns
-            if endpoint and key not in DISPLAY_COLUMNS.get(endpoint):
-                continue
             # Format values that are timestamps
-            if 'added' in key or 'edited' in key:
+            if key in AGE_KEYS:
                 val = get_datetime_age(val)
             # rename the keys
             new_data[KEY_MAPS.get(key) or key.upper()] = val
@@ -164,6 +201,8 @@ def table(data: Union[list, dict], endpoint: Optional[str] = None):
         endpoint (str): The endpoint the data has returned from.
     """
 
+    from tabulate import tabulate
+
     display_data = format_display_data(data, endpoint)
     table_data = tabulate(display_data, **CONFIG_DISPLAY_TABLE)
     click.echo(table_data)
@@ -186,19 +225,23 @@ def handle_output(
     elif output == OutputFormat.json:
         data = json.dumps(data, indent=4, sort_keys=True)
         if sys.stdout.isatty(): # TODO: use isatty() in the click.echo for color
+            highlight, formatter, json_lexer, _ = _get_highlighter()
             data = highlight(
                 data,
-                lexers.JsonLexer(),
-                PYGMENTS_FORMATTER,
+                json_lexer,
+                formatter,
             )
         click.echo(data)
     elif output == OutputFormat.yaml:
+        import yaml
+
         data = yaml.dump(data)
         if sys.stdout.isatty():
+            highlight, formatter, _, yaml_lexer = _get_highlighter()
             data = highlight(
                 data,
-                lexers.YamlLexer(),
-                PYGMENTS_FORMATTER,
+                yaml_lexer,
+                formatter,
             )
         click.echo(data)
 
@@ -220,42 +263,45 @@ def format_log(
 
     # Format timestamp
     timestamp, log = log
-    timezone_offset = datetime.now(timezone.utc).astimezone().utcoffset()
-    timestamp_utc = datetime.fromtimestamp(int(timestamp) // 1e9)
-    timestamp = timestamp_utc + timezone_offset
+    timestamp_utc = datetime.fromtimestamp(int(timestamp) // 1_000_000_000)
+    timestamp = timestamp_utc + LOCAL_UTC_OFFSET
 
     if " " not in log:
         return None
 
     # Get verbosity
-    verbosity = "I"
-    for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-        verbosity = level[0] if level in log else verbosity
+    level_match = LOG_LEVEL_PATTERN.search(log)
+    verbosity = level_match.group(1)[0] if level_match else "I"
 
     # Remove existing "INFO 54:32 >>"
-    if ">>" in log:
-        log = log.split(">>", 1)[1]
-
-    # Remove the TaskID from operator server log
-    # 00:37:37.000 operator-serve I: Task:3-simplefunction1g-d1bf610e-6v4:#30 DONE 0.0s
-    # becomes
-    # 00:37:37.000 operator-serve I: #30 DONE 0.0s
-    log = re.sub(r"Task:.*:", "", log)
+    _, separator, remainder = log.partition(">>")
+    if separator:
+        log = remainder
 
     # Rename "operator-serve" to "build-log" so it's more meaningful to users
     container_name = container_name.replace("operator-serve", "build-log")
 
-    # Remove IP addresses
-    log = IP_ADDRESS_PATTERN.sub("", log)
-
-    # Remove double spacing
-    log = " ".join(log.split())
+    # Strip the operator TaskID and internal IP addresses and collapse
+    # double spacing in one pass:
+    # 00:37:37.000 operator-serve I: Task:3-simplefunction1g-d1bf610e-6v4:#30 DONE 0.0s
+    # becomes
+    # 00:37:37.000 operator-serve I: #30 DONE 0.0s
+    log = LOG_CLEAN_PATTERN.sub(" ", log).strip()
 
     # Format log
     formatted_log = (timestamp, f"{container_name} {verbosity}: {log}")
     return formatted_log
 
 
+def _container_log_stream(container_name: str, container: list):
+    """ Yield formatted logs of one container, preserving server order. """
+    for log in container:
+        if log:
+            formatted = format_log(log, container_name)
+            if formatted is not None:
+                yield formatted
+
+
 def display_logs(data: dict):
     """Displays logs.
 
@@ -263,22 +309,19 @@ def display_logs(data: dict):
         data (dict): The data to display.
     """
 
-    # Format logs
-    logs = list(filter(
-        lambda log: log is not None,
-        (
-            format_log(log, container_name)
-            for container_name, container in data.items()
-            for log in container
-            if log
-        )
-    ))
-
-    # Sort them by timestamp
-    sorted_logs = sorted(logs, key=lambda log: log[0].timestamp())
+    # Each container's logs arrive in timestamp order, so interleave the
+    # already-sorted streams instead of sorting the flattened list
+    streams = [
+        _container_log_stream(container_name, container)
+        for container_name, container in data.items()
+    ]
 
     # Print response
     # TODO: color the logs!
-    for log in sorted_logs:
+    # write straight to stdout: click.echo flushes per line, which stalls
+    # large dumps and piping into pagers
+    write = sys.stdout.write
+    for log in heapq.merge(*streams, key=lambda log: log[0]):
         timestamp = log[0].strftime("%H:%M:%S.%f")[:-3]
-        click.echo(f"{timestamp} {log[1]}")
+        write(f"{timestamp} {log[1]}\n")
+    sys.stdout.flush()
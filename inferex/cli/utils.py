@@ -1,5 +1,6 @@
 """ Reusable classes and decorators for Click commands. """
 import sys
+from bisect import bisect_left
 from gettext import gettext as _
 from typing import Dict, List, Optional
 
@@ -38,6 +39,8 @@ class CustomGroup(click.Group):
         """
         # storage for custom priority
         self.command_priority = {}
+        # sorted command-name table, built lazily for prefix matching
+        self._sorted_names = None
         super(CustomGroup, self).__init__(*args, **kwargs)
 
     def get_command(self, ctx: Context, command_name: str) -> Optional[Command]:
@@ -62,14 +65,22 @@ class CustomGroup(click.Group):
         if command is not None:
             return command
 
-        # else check for commands with matching prefix
-        matches = [command for command in self.list_commands(ctx)
-                   if command.startswith(command_name)]
+        # else check for commands with matching prefix in the sorted name
+        # table: bisect to the first candidate, then walk the contiguous
+        # range of prefix matches, bailing out as soon as it is ambiguous
+        if self._sorted_names is None:
+            self._sorted_names = tuple(sorted(self.commands))
+        matches = []
+        for index in range(bisect_left(self._sorted_names, command_name), len(self._sorted_names)):
+            name = self._sorted_names[index]
+            if not name.startswith(command_name):
+                break
+            matches.append(name)
+            if len(matches) > 1:
+                ctx.fail(f"Too many command matches: {', '.join(matches)}. Try using one of these commands.")
         if not matches:
             return None
-        if len(matches) == 1:
-            return click.Group.get_command(self, ctx, matches[0])
-        ctx.fail(f"Too many command matches: {', '.join(sorted(matches))}. Try using one of these commands.")
+        return click.Group.get_command(self, ctx, matches[0])
 
     def get_col_spacing(self, commands: List[tuple], min_spacing: int=2) -> Dict:
         """ Returns correct column spacing for aligning help text
@@ -193,6 +204,7 @@ class CustomGroup(click.Group):
             TypeError: When no name is specified.
         """
         super(CustomGroup, self).add_command(command, name)
+        self._sorted_names = None  # invalidate the prefix-match table
 
         # store the command group and priority of the command
         name = name or command.name
@@ -270,10 +282,10 @@ def fetch_and_handle_response(func, path, exit_on_error=True, *args, **kwargs):
             sys.exit()
         raise
 
-    if "application/json" in response.headers.get('Content-Type', {}):
-        content = response.json()
-    else:
-        content = response.content
+    # parse the body once and branch on the result
+    content_type = response.headers.get('Content-Type') or ''
+    is_json = "application/json" in content_type
+    content = response.json() if is_json else response.content
 
     # non-200 response
     if not response.ok:
@@ -285,7 +297,7 @@ def fetch_and_handle_response(func, path, exit_on_error=True, *args, **kwargs):
         sys.exit()
 
     # no json data is returned
-    if "application/json" not in response.headers.get('Content-Type', {}):
+    if not is_json:
         error(
             f"""No data returned for request to /{path}
                 status_code: {response.status_code}
@@ -293,10 +305,9 @@ def fetch_and_handle_response(func, path, exit_on_error=True, *args, **kwargs):
         )
         sys.exit()
 
-    response_dict = response.json()
-    if not response_dict:
+    if not content:
         # TODO: display an empty table as it implies this?
         click.echo(f"No results from query to /{path} with args {args}")
         sys.exit()
 
-    return response_dict
+    return content
@@ -1,14 +1,20 @@
+import hashlib
+import re
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
-import yaml
-from cerberus import Validator
 from inferex.cli.terminal_format import error, info
 
+# yaml and cerberus are imported lazily below; only commands that actually
+# read a project config should pay their import cost
 
-DEPLOYMENT_MEMORY_REGEX = r"(?P<value>\d+)(?:Gi|G)$"
+# \A..\Z anchors reject trailing-newline values that $ lets through, and
+# re.ASCII keeps \d from matching unicode digits
+DEPLOYMENT_MEMORY_REGEX = re.compile(r"\A(?P<value>\d+)(?:Gi|G)\Z", re.ASCII)
 
-DEPLOYMENT_CPU_REGEX = r"(?P<value>\d+)m?$"
+DEPLOYMENT_CPU_REGEX = re.compile(r"\A(?P<value>\d+)m?\Z", re.ASCII)
 
 CONFIG_SCHEMA = {
     "project": {
@@ -26,18 +32,44 @@ CONFIG_SCHEMA = {
 
                 "minlength": 2,
                 "maxlength": 20,
-                "regex": DEPLOYMENT_MEMORY_REGEX
+                "check_with": "memory"
             },
             "cpu": {
                 "type": ["string", "number"],
                 "minlength": 1,
                 "maxlength": 20,
-                "regex": DEPLOYMENT_CPU_REGEX
+                "check_with": "cpu"
             },
         },
     },
 }
 
+
+@lru_cache(maxsize=None)
+def _get_validator():
+    """ Import Cerberus and build the config validator on first use.
+
+    Built once: Cerberus normalizes the schema at construction, and
+    validate() resets error state, so one instance serves every call. The
+    check_with handlers reuse the patterns compiled at import time rather
+    than the string "regex" rules Cerberus re-compiles per validate().
+    """
+    from cerberus import Validator
+
+    class ConfigValidator(Validator):
+        """ Cerberus validator using the precompiled deployment regexes. """
+
+        def _check_with_memory(self, field, value):
+            if isinstance(value, str) and not DEPLOYMENT_MEMORY_REGEX.match(value):
+                self._error(field, f"value does not match regex '{DEPLOYMENT_MEMORY_REGEX.pattern}'")
+
+        def _check_with_cpu(self, field, value):
+            if isinstance(value, str) and not DEPLOYMENT_CPU_REGEX.match(value):
+                self._error(field, f"value does not match regex '{DEPLOYMENT_CPU_REGEX.pattern}'")
+
+    return ConfigValidator(CONFIG_SCHEMA)
+
+
 DEFAULT_PROJECT = {
     "project": {
         "name": "untitled"
@@ -53,6 +85,52 @@ class ConfigSchemaException(Exception):
     """ Exception to raise when errors are encountered in inferex.yaml validation. """
 
 
+# validated configs keyed by content hash, so mtime bumps with unchanged
+# bytes (editor saves, touch) still hit; LRU-evicted beyond maxsize
+_CONTENT_CACHE: "OrderedDict[bytes, dict]" = OrderedDict()
+_CONTENT_CACHE_MAXSIZE = 8
+
+
+@lru_cache(maxsize=32)
+def _load_project_config(path_str: str, mtime_ns: int, size: int) -> dict:
+    """ Parse and validate a config once per (path, mtime, size).
+
+    Edits invalidate the entry; an invalid config raises, which lru_cache
+    does not memoize, so broken files are re-checked on every call. A
+    content-hash cache sits underneath so a bare touch — new mtime, same
+    bytes — skips the parse and validation too.
+
+    Raises:
+        ConfigSchemaException: Raised when the config fails schema validation.
+    """
+    import yaml
+
+    source = Path(path_str).read_bytes()
+    # blake2b runs at GB/s; hashing a small yaml costs microseconds
+    content_key = hashlib.blake2b(source, digest_size=16).digest()
+    project_config = _CONTENT_CACHE.get(content_key)
+    if project_config is not None:
+        _CONTENT_CACHE.move_to_end(content_key)
+        return project_config
+
+    # prefer the libyaml-backed loader when PyYAML was built with it
+    project_config = yaml.load(
+        source, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    )
+
+    validator = _get_validator()
+    if not validator.validate(project_config):
+        error("Project config file is invalid:")
+        info(str(validator.errors))
+        raise ConfigSchemaException
+
+    _CONTENT_CACHE[content_key] = project_config
+    if len(_CONTENT_CACHE) > _CONTENT_CACHE_MAXSIZE:
+        _CONTENT_CACHE.popitem(last=False)
+
+    return project_config
+
+
 def get_project_config(project_path: Union[Path, None]) -> dict:
     """Read inferex.yaml and return the project dictionary
 
@@ -72,20 +150,17 @@ def get_project_config(project_path: Union[Path, None]) -> dict:
     if not config_path.exists():
         return {}
 
-    # Read the config file
+    import yaml
+
+    # Read and validate the config, reusing both the parse and the schema
+    # check from earlier in this invocation
     try:
-        with open(config_path, "r", encoding="utf-8") as file:
-            project_config = yaml.safe_load(file)
+        config_stat = config_path.stat()
+        project_config = _load_project_config(
+            str(config_path), config_stat.st_mtime_ns, config_stat.st_size
+        )
     except yaml.YAMLError as exc:
         error(str(exc))
         raise exc
 
-    # Validate the config file
-    validator = Validator(CONFIG_SCHEMA)
-    valid = validator.validate(project_config)
-    if not valid:
-        error("Project config file is invalid:")
-        info(str(validator.errors))
-        raise ConfigSchemaException
-
     return project_config
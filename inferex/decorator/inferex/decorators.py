@@ -1,12 +1,59 @@
 """
 Decorator used to wrap inference functions in the users pipeline.
 """
-from functools import wraps
+from functools import lru_cache
 from typing import Callable
 
 
+# Callable wrapper around a user's inference function. A slotted class with
+# a plain __call__ is cheaper per invocation than a closure wrapper, and it
+# keeps the pipeline metadata as instance attributes for discovery.
+class _Pipeline:
+
+    __slots__ = (
+        "func",
+        "is_decorated_",
+        "name_",
+        "is_async_",
+        "timeout_",
+        "cached_func",
+        "cache_info_",
+        "__name__",
+        "__wrapped__",
+    )
+
+    def __init__(self, func: Callable, name: str, is_async: bool, timeout: int, cache: int):
+        self.func = func
+        self.is_decorated_ = True  # Necessary for pipeline discovery
+        self.name_ = name
+        self.is_async_ = is_async
+        self.timeout_ = timeout
+        if cache and not is_async:
+            self.cached_func = lru_cache(maxsize=cache)(func)
+            self.cache_info_ = self.cached_func.cache_info
+        else:
+            self.cached_func = None
+            self.cache_info_ = None
+        self.__name__ = func.__name__
+        self.__wrapped__ = func
+
+    # delegate so help()/introspection show the user's docstring
+    __doc__ = property(lambda self: self.func.__doc__)
+
+    def __call__(self, *args, **kwargs):
+        if self.cached_func is not None:
+            try:
+                return self.cached_func(*args, **kwargs)
+            except TypeError:
+                # unhashable inputs cannot be memoized
+                pass
+
+        # - call locally (in process)
+        return self.func(*args, **kwargs)
+
+
 def pipeline(
-    name: str=None, is_async: bool=False, timeout: int=None
+    name: str=None, is_async: bool=False, timeout: int=None, cache: int=None
 ) -> Callable:
     """ Wrapper for inference functions in the users pipeline.
 
@@ -14,6 +61,9 @@ def pipeline(
         name (str): The name of this pipeline.
         is_async (bool): Whether to use async inference.
         timeout (int): The timeout for inference.
+        cache (int): Memoize up to this many results of the (pure, sync)
+            inference function. Calls with unhashable inputs bypass the
+            cache; hit/miss stats are exposed as ``cache_info_``.
 
     Returns:
         decorator (Callable): The wrapped inference function.
@@ -26,21 +76,8 @@ def pipeline(
             func: The users function to decorate
 
         Returns:
-            wrapper: The decorated function
+            wrapper: The wrapped function
         """
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-
-            # - call locally (in process)
-            response = func(*args, **kwargs)
-
-            return response
-
-        wrapper.is_decorated_ = True  # Necessary for pipeline discovery
-        wrapper.name_ = name
-        wrapper.is_async_ = is_async
-        wrapper.timeout_ = timeout
-        return wrapper
+        return _Pipeline(func, name=name, is_async=is_async, timeout=timeout, cache=cache)
 
     return decorator
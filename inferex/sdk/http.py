@@ -4,16 +4,16 @@ import sys
 import platform
 from urllib.parse import urljoin
 from pathlib import Path
-from dotenv import load_dotenv
 from typing import Union, BinaryIO
 
 import requests
 from requests import Response
 from requests.adapters import HTTPAdapter, Retry
 from requests.exceptions import RequestException
-from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
-from tqdm import tqdm
-import yaspin
+
+# requests_toolbelt, tqdm, yaspin and dotenv are imported lazily in the
+# functions that need them; metadata commands never touch them and their
+# import cost lands on every CLI startup otherwise
 
 from inferex import __version__
 from inferex.sdk.settings import settings
@@ -24,6 +24,9 @@ from inferex.sdk.exceptions import InferexApiError
 
 logger = get_logger(__name__)
 
+# computed once; platform.system() can shell out on some OSes
+_USER_AGENT = f"inferex v{__version__} {platform.system()}"
+
 retry_strategy = Retry(
     total=3,
     backoff_factor=0.2,
@@ -40,17 +43,35 @@ class ApiClientSession(requests.Session):
         super().__init__()
         self.base_url = base_url
         self.verify = verify
-        self.headers['Accept'] = "application/json"
-        self.headers['Authorization'] = f"Bearer {api_token}"
-        self.headers['User-Agent'] = f"inferex v{__version__} {platform.system()}"
+        self.headers.update({
+            'Accept': "application/json",
+            'User-Agent': _USER_AGENT,
+            'Connection': "keep-alive",
+        })
+        self.set_token(api_token)
         self.hooks['response'] = [self.log_response, self.handle_errors]
-        self.mount('http://', HTTPAdapter(max_retries=retry_strategy))
-        self.mount('https://', HTTPAdapter(max_retries=retry_strategy))
+        # keep-alive pool sized for the deploy flow (create → upload → 1s
+        # status polls) so polling reuses one TLS session instead of
+        # re-handshaking per request
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=4,
+            pool_maxsize=16,
+            pool_block=False,
+        )
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
 
-    def request(self, method, url_path, params=None, data=None, headers=None) -> Response:
+    def request(self, method, url_path, params=None, data=None, headers=None, stream=False) -> Response:
         """ Send a request to the configured server. """
         request_url = urljoin(self.base_url, url_path)
-        headers = {**self.headers, **headers} if headers else self.headers
+        # only allocate a merged dict when the caller actually adds headers
+        if headers:
+            merged = self.headers.copy()
+            merged.update(headers)
+            headers = merged
+        else:
+            headers = self.headers
         # don't spin on status checks
         if "status" not in url_path:
             progress_bar = start_progress_bar(data)
@@ -63,7 +84,8 @@ class ApiClientSession(requests.Session):
             request_url,
             params=params,
             data=data,
-            headers=headers
+            headers=headers,
+            stream=stream
         )
         except Exception as exc:
             logger.error(exc)
@@ -73,7 +95,7 @@ class ApiClientSession(requests.Session):
                 status_code = ""
             if (
                 hasattr(exc, "response") and exc.response is not None and
-                "application/json" in exc.response.headers.get("Content-Type", {})
+                "application/json" in exc.response.headers.get("Content-Type", "")
                 ):
                 detail = "\n" + exc.response.json().get("detail", "")
             else:
@@ -94,8 +116,24 @@ class ApiClientSession(requests.Session):
         on the response's status code.
         """
         level = 20 if resp.status_code < 400 else 40
-        content = resp.json() if 'application/json' in resp.headers.get('Content-Type', '') else resp.content
-        logger.log(level=level, msg=f"Status code: {resp.status_code}, Server msg: {content}")
+        if not logger.isEnabledFor(level):
+            return
+        content_type = resp.headers.get('Content-Type', '')
+        if 'text/event-stream' in content_type:
+            # reading the body here would consume the live event stream
+            logger.log(level=level, msg=f"Status code: {resp.status_code}, event stream opened")
+            return
+        if 'application/json' in content_type:
+            content = resp.json()
+            # hand the parsed body to downstream .json() callers for free
+            resp.json = lambda **kwargs: content
+            preview = repr(content)
+        else:
+            preview = resp.content
+        # cap the logged body; non-JSON responses can run to megabytes
+        if len(preview) > 512:
+            preview = preview[:512]
+        logger.log(level=level, msg=f"Status code: {resp.status_code}, Server msg: {preview}")
 
     def handle_errors(self, resp: Response, **kwargs) -> Response:  # pylint: disable=W0613
         """
@@ -139,6 +177,8 @@ def init():
     Returns:
         login(): Calls login with environment username and password.
     """
+    from dotenv import load_dotenv
+
     import inferex
     project_root = os.path.abspath(os.path.dirname(inferex.__file__))
     inferex_file = Path(project_root) / ".inferex"
@@ -193,7 +233,7 @@ def login(**kwargs):
     return 0
 
 
-def start_progress_bar(data: Union[dict, MultipartEncoderMonitor]):
+def start_progress_bar(data: Union[dict, "MultipartEncoderMonitor"]):
     """
     Display a progress spinner while the request is in progress.
 
@@ -207,7 +247,10 @@ def start_progress_bar(data: Union[dict, MultipartEncoderMonitor]):
     if not sys.stdout.isatty():
         return create_patched_progress_bar()
 
-    if isinstance(data, MultipartEncoderMonitor):
+    # duck-type for an encoder monitor so requests_toolbelt stays unimported
+    # on the metadata paths
+    if hasattr(data, "bundle_size"):
+        from tqdm import tqdm
         # TODO: make progress bar show fully complete after upload is done (even for small payloads)
         progress_bar = tqdm(
             desc="☁️  Uploading",
@@ -220,6 +263,8 @@ def start_progress_bar(data: Union[dict, MultipartEncoderMonitor]):
         )
         data.callback = lambda monitor: progress_bar.update(monitor.bytes_read - progress_bar.n)
     else:
+        import yaspin
+
         # TODO: make spinner logs disappear after it's finished
         progress_bar = yaspin.yaspin(text="Waiting on server response...", color=SPINNER_COLOR)
         progress_bar.close = progress_bar.stop
@@ -228,11 +273,23 @@ def start_progress_bar(data: Union[dict, MultipartEncoderMonitor]):
     return progress_bar
 
 
+class _NoopBar:
+    """ Stand-in progress bar for non-interactive output. """
+
+    __slots__ = ()
+
+    def close(self):
+        pass
+
+
+_NOOP_BAR = _NoopBar()
+
+
 def create_patched_progress_bar():
-    return type("", (object,), {'close': lambda _: None})()
+    return _NOOP_BAR
 
 
-def create_multipart_encoder_monitor(path: str, file: BinaryIO) -> MultipartEncoderMonitor:
+def create_multipart_encoder_monitor(path: str, file: BinaryIO) -> "MultipartEncoderMonitor":
         """
         Creates a MultipartEncoderMonitor instance to stream data on uploads
         and create a progress bar with.
@@ -244,11 +301,16 @@ def create_multipart_encoder_monitor(path: str, file: BinaryIO) -> MultipartEnco
         Returns:
             monitor (MultipartEncoderMonitor): The encoder monitor to use as data in requests.
         """
+        from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+
+        # rewind and size through the fd: the encoder then streams straight
+        # from disk and peak memory stays at chunk-buffer size, not O(bundle)
+        file.seek(0)
+        bundle_size = os.fstat(file.fileno()).st_size
         encoder = MultipartEncoder(
             fields = {"file": (path, file, "application/x-xz")}
         )
         monitor = MultipartEncoderMonitor(encoder, None)
-        bundle_size = Path(path).stat().st_size
         monitor.bundle_size = bundle_size
         return monitor
 
@@ -1,19 +1,23 @@
 import os
 import logging
+from functools import lru_cache
 
 
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# read once; get_logger is called at import time all over the package
+_IX_DEBUG = os.getenv("IX_DEBUG")
+
+@lru_cache(maxsize=None)
 def get_logger(logger_name: str):
     """ Setup and return a logger instance. """
     logger = logging.getLogger(logger_name)
-    development_environment = os.getenv("IX_DEBUG")
-    if development_environment:
+    if _IX_DEBUG and not logger.handlers:
         handler = logging.StreamHandler()
         log_format = logging.Formatter(LOG_FORMAT, TIME_FORMAT)
         handler.setFormatter(log_format)
         logger.addHandler(handler)
-    verbosity_level = logging.DEBUG if development_environment else logging.WARNING
+    verbosity_level = logging.DEBUG if _IX_DEBUG else logging.WARNING
     logger.setLevel(verbosity_level)
     return logger
@@ -6,7 +6,16 @@ from pathlib import Path
 from pydantic import BaseModel
 
 
-class ProjectBase(BaseModel):
+class ResourceBase(BaseModel):
+    """ Shared config for resource models. """
+
+    class Config:
+        # API rows are hydrated in bulk; skip the defensive deep-copy
+        # pydantic v1 performs on nested model validation
+        copy_on_model_validation = 'none'
+
+
+class ProjectBase(ResourceBase):
     """ Defines 'project' data structure. """
 
     # present client-side
@@ -19,7 +28,7 @@ class ProjectBase(BaseModel):
     terminated_at:          Optional[str]
 
 
-class DeploymentBase(BaseModel):
+class DeploymentBase(ResourceBase):
     """ Defines 'deployment' data structure. """
 
     # present client-side
@@ -39,7 +48,7 @@ class DeploymentBase(BaseModel):
     project_name:           Optional[str]
 
 
-class PipelineBase(BaseModel):
+class PipelineBase(ResourceBase):
     """ Defines 'pipeline' data structure."""
     git_sha:                Optional[str]
     project_name:           Optional[str]
@@ -51,7 +60,7 @@ class PipelineBase(BaseModel):
     is_async:               Optional[str]
 
 
-class LogBase(BaseModel):
+class LogBase(ResourceBase):
     """ Defines 'logs' data strucutre. """
     # present client-side
     git_sha:                Optional[str]
@@ -1,5 +1,6 @@
 """ Settings management (API url, config file, path, API version...) """
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from click.utils import get_app_dir
@@ -8,13 +9,47 @@ from pydantic import BaseSettings, Field
 from inferex import __app_name__
 from inferex.sdk.logs import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = get_logger(__name__)
 
+
+@lru_cache(maxsize=8)
+def _app_dir(app_name: str) -> str:
+    """ Resolve (and memoize) the platform-specific application directory. """
+    return get_app_dir(app_name)
+
+
+@lru_cache(maxsize=4)
+def _load_config(path_str: str, mtime_ns: int) -> dict:
+    """ Parse the config file once per (path, mtime); edits invalidate. """
+    if orjson is not None:
+        return orjson.loads(Path(path_str).read_bytes())
+    with open(path_str, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+@lru_cache(maxsize=64)
+def get_config_file_path(app_name: str, filename: str) -> Path:
+    """ Return the memoized path of a config file inside the app directory.
+
+    Args:
+        app_name: Name of the application owning the directory.
+        filename: Name of the config file.
+
+    Returns:
+        Path: Full path to the config file.
+    """
+    return Path(_app_dir(app_name)) / filename
+
+
 class ClientSettings(BaseSettings):
     """ Settings class, inherits from pydantic BaseSettings. """
 
-    config_path: Path = Field(default=Path(get_app_dir(__app_name__)) / "config.json")
+    config_path: Path = Field(default=get_config_file_path(__app_name__, "config.json"))
     api_token: str = Field(default="", env='INFEREX_TOKEN')
     base_url: str = Field(default="https://api.inferex.com", env="INFEREX_API")
     api_vers: str = Field(default="", env="INFEREX_API_VERSION")
@@ -26,10 +61,13 @@ class ClientSettings(BaseSettings):
 
     def write_token(self, token) -> None:
         """ Write token to the filesystem and update. """
-        data = self.read_config() if self.config_path.exists() else {}
+        data = self.read_config()
         data['access_token'] = token
-        with open(self.config_path, "w", encoding=self.__config__.env_file_encoding) as json_file:
-            json.dump(data, json_file)
+        if orjson is not None:
+            self.config_path.write_bytes(orjson.dumps(data))
+        else:
+            with open(self.config_path, "w", encoding=self.__config__.env_file_encoding) as json_file:
+                json.dump(data, json_file)
         self.api_token = token
         logger.info(f"Token written to {self.config_path}")
 
@@ -37,9 +75,12 @@ class ClientSettings(BaseSettings):
         """ Read the user's config file from the filesystem. """
         data = None
         try:
-            with open(self.config_path, "r", encoding=self.__config__.env_file_encoding) as file:
-                data = json.load(file)
-        except (json.JSONDecodeError, FileNotFoundError) as exc:
+            # a single stat keys the memoized parse and replaces the
+            # separate exists() probe callers used to pay
+            mtime_ns = self.config_path.stat().st_mtime_ns
+            data = _load_config(str(self.config_path), mtime_ns)
+        except (ValueError, FileNotFoundError) as exc:
+            # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
             logger.info(exc)
 
         if data:
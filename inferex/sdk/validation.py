@@ -1,7 +1,9 @@
 """ Functions for validating Inferex projects. """
 import ast
-import fnmatch
+import mmap
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
 from typing import List, Union
 
@@ -10,55 +12,44 @@ from inferex.sdk.logs import get_logger
 
 logger = get_logger(__name__)
 
-VALID_PIPELINE_KWS = ['name', 'is_async', 'timeout', ]
-
-def pre_walk_dir_check(path: str) -> None:
-    """
-    Check the to-be-deployed directory for .py files up to two levels deep.
-    If there are none, raise an exception.
-
-    Example: a user issues `inferex deploy` from their root directory. Instead
-    of recursively walking all folders and files, exit early.
-
-    Args:
-        path(str): the project directory to check
-
-    Raises:
-        Exception: if there are no python files in the project dir, or in
-                   subfolders 1 level beneath the project dir.
-    """
-    project_root_files = list(fnmatch.filter(os.listdir(path), "*.py"))
-    project_root_folders = [p for p in os.listdir(path) if os.path.isdir(p)]
-    subfolder_python_files = []
-    for folder in project_root_folders:
-        subfolder_python_files.extend(list(fnmatch.filter(os.listdir(folder), "*.py")))
-
-    if not project_root_files and not subfolder_python_files:
-        raise Exception(
-            f"No python files found in or directly beneath {path}. "
-            "Is this the right directory?"
-        )
-
+# frozenset for the membership test; the tuple keeps the error message order
+VALID_PIPELINE_KWS = frozenset({'name', 'is_async', 'timeout', 'cache'})
+_VALID_PIPELINE_KWS_DISPLAY = ('name', 'is_async', 'timeout', 'cache')
 
+# below this many files the pool startup costs more than the parses
+_PARALLEL_PARSE_THRESHOLD = 8
 
 def get_python_filepaths(path: str) -> list:
     """ Given a directory, look for '*.py" files recursively and return a list
         of filepaths.
 
+    The empty check that used to live in a separate two-level pre-walk (which
+    also resolved subfolders against the cwd rather than `path`) happens on
+    the same traversal now.
+
     Args:
         path(str): the project directory to check
 
     Returns:
         python_filepaths(list): a list of fullpaths to python files in the
             project directory.
+
+    Raises:
+        Exception: if there are no python files in the project directory.
     """
-    pre_walk_dir_check(path)
     python_filepaths = []
     for root, _, filenames in os.walk(path):
+        # endswith is a single C call per name; fnmatch compiles and runs
+        # a regex for the same "*.py" test
         python_filepaths.extend(
-            os.path.join(
-                root, filename
-            ) for filename in fnmatch.filter(filenames, "*.py")
+            os.path.join(root, filename)
+            for filename in filenames if filename.endswith(".py")
+        )
+
+    if not python_filepaths:
+        raise Exception(
+            f"No python files found in {path}. "
+            "Is this the right directory?"
         )
 
     return python_filepaths
@@ -75,10 +66,16 @@ def traverse_attribute(node: object) -> Union[str, None]:
     Returns:
         string: the name/id of the node object.
     """
-    if isinstance(node, ast.Attribute):
-        return f"{traverse_attribute(node.value)}.{node.attr}"
-    elif isinstance(node, ast.Name):
-        return node.id
+    # iterative: one list and one join instead of a string allocation
+    # per recursion level
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+    return None
 
 
 def parse_decorators(decorators: List[object]) -> List[str]:
@@ -101,8 +98,8 @@ def parse_decorators(decorators: List[object]) -> List[str]:
 
         decorator_name = traverse_attribute(decorator.func)
 
-        # not an inferex decorator
-        if "pipeline" not in decorator_name:
+        # not an inferex decorator (or not a plain dotted name at all)
+        if not decorator_name or "pipeline" not in decorator_name:
             continue
 
         if len(decorator.args) > 0:
@@ -113,7 +110,7 @@ def parse_decorators(decorators: List[object]) -> List[str]:
             if keyword.arg not in VALID_PIPELINE_KWS:
                 raise ValueError(
                     f"Unsupported keyword in pipeline decorator. "
-                    f"Supported keywords are: {', '.join(VALID_PIPELINE_KWS)}"
+                    f"Supported keywords are: {', '.join(_VALID_PIPELINE_KWS_DISPLAY)}"
                 )
             # check if name string is hyphenated alphanumeric
             if keyword.arg == "name":
@@ -129,6 +126,67 @@ def parse_decorators(decorators: List[object]) -> List[str]:
     return pipeline_urls
 
 
+class _PipelineVisitor(ast.NodeVisitor):
+    """ Collect pipeline urls from top-level and class-level function defs.
+
+    Descends only module and class bodies — the only places a decorated
+    pipeline can legally live — so large files cost O(top-level decls)
+    instead of the O(all nodes) an ``ast.walk`` pays.
+    """
+
+    def __init__(self):
+        self.pipeline_urls = []
+
+    def visit_FunctionDef(self, node):  # pylint: disable=C0103
+        # deliberately no generic_visit: nested defs are not pipelines
+        self.pipeline_urls.extend(parse_decorators(node.decorator_list))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+
+def _parse_file_pipelines(path: str) -> List[str]:
+    """
+    Read one python file and return the pipeline urls it declares.
+
+    Module-level so a process pool can pickle it; AST trees are not
+    picklable, so only the extracted urls cross process boundaries.
+
+    Args:
+        path(str): path of the python file to parse.
+
+    Raises:
+        OSError: If reading the file failed.
+
+    Returns:
+        pipeline_urls(list): urls declared in pipeline decorators.
+    """
+    try:
+        with open(path, "rb") as f:
+            try:
+                # let the OS page the file in; the prescreen scans the
+                # mapping without copying it into a Python buffer first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # most files never mention pipelines; a find() over the
+                    # mapping is far cheaper than building their AST
+                    if mm.find(b"pipeline") == -1:
+                        return []
+                    source = bytes(mm)
+            except ValueError:
+                # mmap rejects zero-byte files, which have no pipelines
+                return []
+    except OSError:
+        raise
+
+    tree = ast.parse(source)
+
+    visitor = _PipelineVisitor()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            visitor.visit(node)
+
+    return visitor.pipeline_urls
+
+
 def validate_pipelines(target_dir: Path) -> bool:
     """
     Walk python files in the project folder and parse their contents.
@@ -160,19 +218,20 @@ def validate_pipelines(target_dir: Path) -> bool:
         OSError: If reading pipeline.py failed.
     """
     python_filepaths = get_python_filepaths(target_dir)
-    parsed_urls = []
-    for path in python_filepaths:
-        try:
-            with open(path, "r") as f:
-                source = f.read()
-        except OSError:
-            raise
-
-        tree = ast.parse(source)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                parsed_urls.extend(parse_decorators(node.decorator_list))
-
-    if len(set(parsed_urls)) < len(parsed_urls):
-        raise ValueError("Pipeline names must be unique.")
+    if len(python_filepaths) >= _PARALLEL_PARSE_THRESHOLD:
+        # parsing is CPU-bound and per-file independent, so large projects
+        # spread it across cores
+        with ProcessPoolExecutor() as executor:
+            url_batches = list(executor.map(
+                _parse_file_pipelines, python_filepaths, chunksize=16
+            ))
+    else:
+        url_batches = (_parse_file_pipelines(path) for path in python_filepaths)
+
+    # a running set fails on the first collision and names the offender,
+    # instead of a full list plus a final set() pass
+    seen_urls = set()
+    for url in chain.from_iterable(url_batches):
+        if url in seen_urls:
+            raise ValueError(f"Pipeline names must be unique (duplicate: {url}).")
+        seen_urls.add(url)